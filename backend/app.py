@@ -17,14 +17,54 @@ except Exception:
     transliterate = None
     sanscript = None
 
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
 import langid
+# Restrict langid to the languages this app can actually target: scoring is
+# O(languages x features), so dropping the ~80 unused models cuts both memory
+# and per-call CPU. Out-of-set input gets mapped to the closest supported
+# language, which is acceptable here.
+langid.set_languages([
+    'en', 'hi', 'ja', 'ko', 'es', 'fr', 'tr', 'nl', 'de', 'ru', 'it',
+    'zh', 'la', 'ar', 'fa', 'ur', 'el', 'sr', 'pt',
+    # not translation targets, but common on the web; keeping their models
+    # loaded stops e.g. Bengali/Indonesian input misclassifying as hi/es
+    'bn', 'id',
+])
 from deep_translator import GoogleTranslator
 
+# deep-translator issues every translation through module-level
+# requests.get, i.e. a cold TCP+TLS handshake per call. Point its google
+# module at a pooled Session instead (a Session is get()-compatible), so
+# consecutive calls reuse warm connections. Guarded: if a future
+# deep-translator stops using `requests.get` this silently no-ops.
+try:
+    import requests as _requests
+    from requests.adapters import HTTPAdapter
+    import deep_translator.google as _dt_google
+
+    _HTTP_SESSION = _requests.Session()
+    _HTTP_SESSION.mount(
+        'https://', HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    )
+    if getattr(_dt_google, 'requests', None) is _requests:
+        _dt_google.requests = _HTTP_SESSION
+except Exception:
+    pass
+
 # optional libs (we try to import; if missing, we fall back gracefully)
 try:
     import pykakasi  # Japanese -> romaji
+    # build the converter once: constructing kakasi() loads the full
+    # morphological tables, far too expensive to repeat per call
+    _KAKASI = pykakasi.kakasi()
 except Exception:
     pykakasi = None
+    _KAKASI = None
 
 try:
     from pypinyin import lazy_pinyin  # Chinese -> pinyin
@@ -44,44 +84,72 @@ try:
 except Exception:
     korean_trans = None
 
+try:
+    import ahocorasick  # single-pass word-map matching for Urdu/Hindi
+except Exception:
+    ahocorasick = None
+
+try:
+    import orjson  # faster JSON parse/serialize for the API endpoint
+except Exception:
+    orjson = None
+
 
 import re
+from unicodedata import normalize as _uninorm
+
+# Hinglish cleanup tables + regexes, built once at import so clean_hinglish
+# doesn't recompile ~16 patterns on every call.
+_DIAC_REPL = {
+    ".N": "n", "M": "n", "~N": "n",
+    ".a": "a", ".i": "i", ".u": "u", ".r": "r",
+}
+_DIAC_RE = re.compile(r"\.N|~N|M|\.a|\.i|\.u|\.r")
+
+_HINGLISH_REPL = {
+    # NOTE: keep re-sorted longest-first below so the alternation engine
+    # tries the longest candidate first and never stops at a short prefix.
+    "maiM": "main",
+    "tumase": "tumse",
+    "pyAra": "pyaar",
+    "karatA": "karta",
+    "hU.n": "hoon",
+    "hU.N": "hoon",
+    "tumheM": "tumhe",
+    "yAda": "yaad",
+    "mujhe": "mujhe",
+    "pUrA": "poora",
+    "yakIna": "yakeen",
+    "tuma": "tum",
+    "aisA": "aisa",
+    "karate": "karte"
+}
+# One alternation -> one pass over the string instead of one re.sub per word.
+# Alternatives are ordered longest-first: re matches them left to right, so
+# this guarantees the longest key wins and prunes redundant backtracking.
+_HINGLISH_REPL = dict(sorted(_HINGLISH_REPL.items(), key=lambda kv: -len(kv[0])))
+_HINGLISH_WORD_RE = re.compile(
+    r"\b(" + "|".join(re.escape(k) for k in _HINGLISH_REPL) + r")\b"
+)
+
+_AA_RE = re.compile(r"aa+")
+_II_RE = re.compile(r"ii+")
+_UU_RE = re.compile(r"uu+")
 
 def clean_hinglish(itrans_text: str) -> str:
     """
     Convert academic-style romanization (Harvard-Kyoto/ITRANS) into
     smoother Hinglish (WhatsApp style).
     """
-    text = itrans_text
-
     # Remove weird diacritics and over-markings
-    text = text.replace(".N", "n").replace("M", "n").replace("~N", "n")
-    text = text.replace(".a", "a").replace(".i", "i").replace(".u", "u")
-    text = text.replace(".r", "r")
-
-    replacements = {
-        "maiM": "main",
-        "tumase": "tumse",
-        "pyAra": "pyaar",
-        "karatA": "karta",
-        "hU.n": "hoon",
-        "hU.N": "hoon",
-        "tumheM": "tumhe",
-        "yAda": "yaad",
-        "mujhe": "mujhe",
-        "pUrA": "poora",
-        "yakIna": "yakeen",
-        "tuma": "tum",
-        "aisA": "aisa",
-        "karate": "karte"
-    }
-    for k, v in replacements.items():
-        text = re.sub(r"\b" + re.escape(k) + r"\b", v, text)
+    text = _DIAC_RE.sub(lambda m: _DIAC_REPL[m.group(0)], itrans_text)
+
+    text = _HINGLISH_WORD_RE.sub(lambda m: _HINGLISH_REPL[m.group(1)], text)
 
     text = text.lower()
-    text = re.sub(r"aa+", "aa", text)
-    text = re.sub(r"ii+", "i", text)
-    text = re.sub(r"uu+", "u", text)
+    text = _AA_RE.sub("aa", text)
+    text = _II_RE.sub("i", text)
+    text = _UU_RE.sub("u", text)
 
     return text.strip()
 
@@ -108,12 +176,31 @@ LANG_MAP = {
     'cyrillic': 'ru', 'sr': 'sr'
 }
 
+# Lookup copy with all-lowercase keys (the literal above had mixed-case
+# entries like 'Dutch' that could never match a lowered input), plus common
+# aliases users actually type.
+_LANG_MAP = {k.lower(): v for k, v in LANG_MAP.items()}
+_LANG_MAP.update({
+    'mandarin': 'zh-CN',
+    'urdu': 'ur', 'ur': 'ur',
+    'arabic': 'ar', 'ar': 'ar',
+    'persian': 'fa', 'farsi': 'fa', 'fa': 'fa',
+    'greek': 'el', 'el': 'el',
+    'portuguese': 'pt', 'pt': 'pt',
+})
+# read-only view with interned keys/values: lookups compare pointers before
+# hashing, and the constant table can't be mutated at request time
+_LANG_MAP = MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _LANG_MAP.items()}
+)
+
 def normalize_target_lang(inp: str) -> str:
     """Return the translation target language code expected by GoogleTranslator."""
     if not inp:
         return 'en'
-    key = inp.strip().lower()
-    return LANG_MAP.get(key, key)
+    # language codes are a small bounded set, safe to intern
+    key = sys.intern(inp.strip().lower())
+    return _LANG_MAP.get(key, key)
 
 # -------------------------
 # Urdu transliteration helpers (improved dictionary + char fallback)
@@ -184,8 +271,60 @@ URDU_CHAR_MAP = {
     'ہ': 'h', 'ھ': 'h',
     'ی': 'y', 'ے': 'e', 'ئ': 'i',
     'ء': "'", 'ٓ': '', 'ٔ': '',
+    # harakat / tanween: drop rather than leak through
+    'ً': '', 'ٌ': '', 'ٍ': '', 'َ': '', 'ُ': '', 'ِ': '', 'ّ': '', 'ْ': '',
 }
 
+# str.translate table: one C-level pass with an O(1) lookup per codepoint,
+# instead of a Python loop calling dict.get per character.
+_URDU_TRANS = str.maketrans(URDU_CHAR_MAP)
+
+
+def _build_automaton(word_map):
+    """Compile a word map into an Aho-Corasick automaton (None if lib missing)."""
+    if not ahocorasick:
+        return None
+    auto = ahocorasick.Automaton()
+    for k, v in word_map.items():
+        auto.add_word(k, (len(k), v))
+    auto.make_automaton()
+    return auto
+
+
+def _ac_romanize(text, automaton, char_fallback):
+    """
+    Single linear sweep over the full text: dictionary hits come from the
+    automaton (longest match wins), everything between hits goes through the
+    character-level fallback. Word boundaries are guarded by checking the
+    characters surrounding each match.
+    """
+    out = []
+    last = 0
+    for end, (length, repl) in automaton.iter_long(text):
+        start = end - length + 1
+        if start > 0 and text[start - 1].isalnum():
+            continue
+        if end + 1 < len(text) and text[end + 1].isalnum():
+            continue
+        if start > last:
+            out.append(char_fallback(text[last:start]))
+        out.append(repl)
+        last = end + 1
+    out.append(char_fallback(text[last:]))
+    return ''.join(out)
+
+
+def _urdu_chars_to_roman(text: str) -> str:
+    return text.translate(_URDU_TRANS)
+
+
+# Splits a token into (leading punctuation, core, trailing punctuation) in
+# one C-level match instead of char-by-char Python loops.
+_WORD_SPLIT_RE = re.compile(r'^(\W*)(.*?)(\W*)$', re.UNICODE)
+
+
+_URDU_AC = _build_automaton(URDU_WORD_MAP)
+
 
 def romanize_urdu_text(text: str) -> str:
     """
@@ -193,35 +332,30 @@ def romanize_urdu_text(text: str) -> str:
     - Try word replacements first (gives natural results for common words)
     - Then fall back to character mapping for remaining characters
     """
+    text = _uninorm('NFC', text)
+    if _URDU_AC is not None:
+        return _ac_romanize(text, _URDU_AC, _urdu_chars_to_roman)
     # Normalize spacing (split by whitespace)
+    word_map = URDU_WORD_MAP  # local binding: skips a global lookup per word
     words = text.split()
     out_words = []
     for w in words:
         # exact-word map
-        if w in URDU_WORD_MAP:
-            out_words.append(URDU_WORD_MAP[w])
+        if w in word_map:
+            out_words.append(word_map[w])
             continue
         # punctuation-aware: strip common punctuation, map, then reattach
-        prefix = ''
-        suffix = ''
-        core = w
-        # preserve punctuation at start/end
-        while core and not core[0].isalnum():
-            prefix += core[0]; core = core[1:]
-        while core and not core[-1].isalnum():
-            suffix = core[-1] + suffix; core = core[:-1]
+        # (single regex match preserves punctuation at start/end)
+        prefix, core, suffix = _WORD_SPLIT_RE.match(w).groups()
         if not core:
             out_words.append(prefix + suffix)
             continue
         # if whole core in dict
-        if core in URDU_WORD_MAP:
-            out_words.append(prefix + URDU_WORD_MAP[core] + suffix)
+        if core in word_map:
+            out_words.append(prefix + word_map[core] + suffix)
             continue
-        # else character-by-character
-        roman = []
-        for ch in core:
-            roman.append(URDU_CHAR_MAP.get(ch, ch))
-        out_words.append(prefix + ''.join(roman) + suffix)
+        # else character-by-character (C-level translate, no Python loop)
+        out_words.append(prefix + core.translate(_URDU_TRANS) + suffix)
     return ' '.join(out_words)
 
 # -------------------------
@@ -235,14 +369,15 @@ ARABIC_CHAR_MAP = {
     'ک': 'k', 'گ': 'g', 'ل': 'l', 'م': 'm', 'ن': 'n', 'و': 'u', 'ه': 'h',
     'ی': 'y', 'ء': "'", 'أ': 'a', 'إ': 'i', 'ؤ': 'u', 'ئ': 'i', 'ى': 'a',
     'آ': 'aa', 'ة': 'a', 'چ':'che', 'ي' : 'i', 'ك' : 'ek', 'پ' :'p',
+    # harakat / tanween (U+064B..U+0652): drop rather than leak through
+    'ً': '', 'ٌ': '', 'ٍ': '', 'َ': '', 'ُ': '', 'ِ': '', 'ّ': '', 'ْ': '',
 }
 
+_ARABIC_TRANS = str.maketrans(ARABIC_CHAR_MAP)
+
 def romanize_arabic_like(text: str) -> str:
     """Rough transliteration for Arabic/Persian script to readable ASCII."""
-    out = []
-    for ch in text:
-        out.append(ARABIC_CHAR_MAP.get(ch, ch))
-    return ''.join(out)
+    return _uninorm('NFC', text).translate(_ARABIC_TRANS)
 
 # Hindi Romanization
 
@@ -307,115 +442,147 @@ HINDI_CHAR_MAP = {
     # Signs / diacritics
     'ं': 'n', 'ँ': 'n', 'ः': 'h', '़': '', '्': '',
     'ौ': 'au', 'ै': 'ai', 'ॉ': 'o', 'ॆ': 'e', 'ॊ': 'o',
+
+    # Vowel matras (dependent forms)
+    'ा': 'aa', 'ि': 'i', 'ी': 'ee', 'ु': 'u', 'ू': 'oo',
+    'ृ': 'ri', 'े': 'e', 'ो': 'o',
 }
 
+# Multi-codepoint entries (conjuncts, nukta pairs) can't go in a translate
+# table, so they get a compiled-alternation pre-pass; the single-codepoint
+# rest goes through str.translate.
+_HINDI_MULTI = {k: v for k, v in HINDI_CHAR_MAP.items() if len(k) > 1}
+_HINDI_MULTI_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_HINDI_MULTI, key=len, reverse=True))
+)
+_HINDI_TRANS = str.maketrans(
+    {k: v for k, v in HINDI_CHAR_MAP.items() if len(k) == 1}
+)
+
+def _hindi_chars_to_roman(text: str) -> str:
+    """Character-level Hindi fallback: conjunct pre-pass + translate."""
+    text = _HINDI_MULTI_RE.sub(lambda m: _HINDI_MULTI[m.group(0)], text)
+    return text.translate(_HINDI_TRANS)
+
+_HINDI_AC = _build_automaton(HINDI_WORD_MAP)
+
+# Fallback word matcher (used when pyahocorasick is unavailable): one
+# longest-first alternation pass over the whole text, boundary-guarded so
+# dictionary words don't match inside longer words.
+_HINDI_WORDSUB_RE = re.compile(
+    r"(?<!\w)(?:"
+    + "|".join(re.escape(k) for k in sorted(HINDI_WORD_MAP, key=len, reverse=True))
+    + r")(?!\w)"
+)
+
 def romanize_hindi_text(text: str) -> str:
     """
     Romanization for Hindi:
     - Check HINDI_WORD_MAP first
     - Else use character-by-character mapping
     """
-    words = text.split()
-    out_words = []
-    for w in words:
-        if w in HINDI_WORD_MAP:
-            out_words.append(HINDI_WORD_MAP[w])
-            continue
-        roman = []
-        for ch in w:
-            roman.append(HINDI_CHAR_MAP.get(ch, ch))
-        out_words.append(''.join(roman))
-    return ' '.join(out_words)
+    text = _uninorm('NFC', text)
+    if _HINDI_AC is not None:
+        return _ac_romanize(text, _HINDI_AC, _hindi_chars_to_roman)
+    # two C-level passes: word alternation, then character translate
+    out = _HINDI_WORDSUB_RE.sub(lambda m: HINDI_WORD_MAP[m.group(0)], text)
+    return _hindi_chars_to_roman(out)
 # -------------------------
 # Rome/romanize dispatcher
 # -------------------------
+# Per-language handlers. Each one is a plain function so the dispatcher can
+# be a single dict lookup instead of a branch cascade re-evaluated per call.
+
+def _romanize_ja(text: str) -> str:
+    """Japanese -> romaji using new pykakasi API."""
+    if _KAKASI:
+        result = _KAKASI.convert(text)
+        return " ".join([item['hepburn'] for item in result])
+    return text  # no pykakasi: return original
+
+def _romanize_zh(text: str) -> str:
+    """Chinese -> pinyin."""
+    if lazy_pinyin:
+        try:
+            return ' '.join(lazy_pinyin(text))
+        except Exception:
+            return text
+    return text
+
+def _romanize_ko(text: str) -> str:
+    """Korean -> hangul-romanize if available."""
+    if korean_trans:
+        try:
+            return korean_trans.translit(text)
+        except Exception:
+            return text
+    return text
+
+def _romanize_hi(text: str) -> str:
+    """Hindi -> try transliterate library (Devanagari -> Latin)."""
+    if transliterate and sanscript:
+        try:
+            raw = transliterate(text, sanscript.DEVANAGARI, sanscript.ITRANS)
+            return clean_hinglish(raw)  # 👈 scrub output into Hinglish
+        except Exception:
+            return romanize_hindi_text(text)  # fallback
+    return romanize_hindi_text(text)
+
+def _romanize_cyrillic(text: str) -> str:
+    """Russian / Serbian / other cyrillic -> transliterate if available."""
+    if translit:
+        try:
+            return translit(text, 'ru', reversed=True)
+        except Exception:
+            return text
+    return text
+
+def _romanize_greek(text: str) -> str:
+    if translit:
+        try:
+            return translit(text, 'el', reversed=True)
+        except Exception:
+            return text
+    return text
+
+_ROMANIZERS = {
+    'ja': _romanize_ja, 'japanese': _romanize_ja,
+    'zh': _romanize_zh, 'zh-cn': _romanize_zh, 'zh-tw': _romanize_zh,
+    'chinese': _romanize_zh,
+    'ko': _romanize_ko, 'korean': _romanize_ko,
+    'ur': romanize_urdu_text, 'urdu': romanize_urdu_text,
+    'hi': _romanize_hi, 'hindi': _romanize_hi,
+    'ar': romanize_arabic_like, 'arabic': romanize_arabic_like,
+    'fa': romanize_arabic_like, 'persian': romanize_arabic_like,
+    'farsi': romanize_arabic_like,
+    'ru': _romanize_cyrillic, 'sr': _romanize_cyrillic,
+    'cyrillic': _romanize_cyrillic, 'russian': _romanize_cyrillic,
+    'el': _romanize_greek, 'greek': _romanize_greek,
+}
+
 def romanize_text(text: str, lang_code: str) -> str:
     """
     Return a romanized/transliterated version of text according to lang_code.
     Falls back to reasonable defaults if optional libs aren't installed.
+    Latin-script targets (and anything unknown) pass through unchanged.
     """
     if not text:
         return text
 
-    # Normalize code forms
-    lc = (lang_code or '').lower()
-
-    # Japanese -> using pykakasi if available
-    # Japanese -> romaji using new pykakasi API
-    if lc.startswith('ja') or lc == 'japanese':
-        if pykakasi:
-           kakasi = pykakasi.kakasi()
-           result = kakasi.convert(text)
-           return " ".join([item['hepburn'] for item in result])
-        else:
-           return text
-  # no pykakasi: return original
-
-    # Chinese -> pinyin
-    if lc.startswith('zh'):
-        if lazy_pinyin:
-            try:
-                return ' '.join(lazy_pinyin(text))
-            except Exception:
-                return text
-        return text
-
-    # Korean -> hangul-romanize if available
-    if lc.startswith('ko') or lc == 'korean':
-        if korean_trans:
-            try:
-                return korean_trans.translit(text)
-            except Exception:
-                return text
-        return text
-
-    # Urdu -> our improved dictionary-based romanizer
-    if lc == 'ur' or lc == 'urdu':
-        return romanize_urdu_text(text)
-
-    # Hindi -> try transliterate library (Devanagari -> Latin)
-    if lc == 'hi' or lc == 'hindi':
-       if transliterate and sanscript:
-          try:
-              raw = transliterate(text, sanscript.DEVANAGARI, sanscript.ITRANS)
-              return clean_hinglish(raw)  # 👈 scrub output into Hinglish
-          except Exception:
-              return romanize_hindi_text(text)  # fallback
-       else:
-          return romanize_hindi_text(text)
-  
-    # Arabic / Persian -> our simple char-map fallback
-    if lc in ('ar', 'arabic', 'fa', 'persian', 'farsi'):
-        return romanize_arabic_like(text)
-
-    # Russian / Serbian / other cyrillic -> transliterate if available
-    if lc in ('ru', 'sr', 'cyrillic', 'russian'):
-        if translit:
-            try:
-                return translit(text, 'ru', reversed=True)
-            except Exception:
-                return text
-        return text
-
-    # Greek
-    if lc in ('el', 'greek'):
-        if translit:
-            try:
-                return translit(text, 'el', reversed=True)
-            except Exception:
-                return text
-        return text
-
-    # Latin-based languages: return as-is (already readable)
-    if lc in ('en', 'fr', 'es', 'it', 'la', 'de', 'pt', 'spanish', 'french', 'italian', 'latin'):
-        return text
-
-    # Default fallback: return original
-    return text
+    handler = _ROMANIZERS.get((lang_code or '').lower())
+    return handler(text) if handler else text
 
 # -------------------------
 # Language detection with confidence and ASCII-short-text fallback
 # -------------------------
+# common English words as one compiled alternation: a single C-level scan
+# instead of eight substring searches, and it also matches at string edges
+_ENGLISH_SIGNALS_RE = re.compile(r"\b(?:the|and|how|you|is|are|hello|hi)\b")
+
+@lru_cache(maxsize=2048)
+def _classify(text: str):
+    return langid.classify(text)
+
 def detect_language_safely(text: str) -> str:
     """
     Use langid to classify language. If confidence is low and text is ASCII,
@@ -423,40 +590,73 @@ def detect_language_safely(text: str) -> str:
     """
     if not text or not text.strip():
         return 'unknown'
-    lang, conf = langid.classify(text)
+    # Classify on a 512-char prefix: langid's accuracy saturates quickly and
+    # this keeps cache keys small for long inputs.
+    lang, conf = _classify(text[:512])
     # if confidence low and text is mostly ASCII letters/punct, prefer English
     if conf < 0.90:
-        # if all characters are ASCII and many English-looking words, assume en
-        num_ascii = sum(1 for ch in text if ord(ch) < 128)
-        if num_ascii / max(1, len(text)) > 0.9:
+        # if all characters are ASCII and many English-looking words, assume en.
+        # str.isascii() covers the dominant all-ASCII case in one C-level pass;
+        # the encode-based ratio handles mostly-ASCII input, also in C.
+        if text.isascii() or len(text.encode('ascii', 'ignore')) / len(text) > 0.9:
             # simple heuristic: presence of common English words
-            lowers = text.lower()
-            english_signals = ['the ', ' and ', ' how ', ' you', ' is ', ' are ', ' hello', ' hi ']
-            if any(sig in lowers for sig in english_signals):
+            if _ENGLISH_SIGNALS_RE.search(text.lower()):
                 return 'en'
     return lang
 
 # -------------------------
 # Main translate + romanize
 # -------------------------
+# Reuse one GoogleTranslator per (thread, target) so the underlying HTTP
+# session keeps its connection pool warm (no TLS handshake per call), and
+# LRU-cache results so repeat inputs skip the network round-trip entirely.
+# Thread-local storage keeps each worker thread's clients to itself.
+_tl = threading.local()
+
+def _get_translator(tgt: str) -> GoogleTranslator:
+    clients = getattr(_tl, 'clients', None)
+    if clients is None:
+        clients = _tl.clients = {}
+    translator = clients.get(tgt)
+    if translator is None:
+        translator = clients[tgt] = GoogleTranslator(source='auto', target=tgt)
+    return translator
+
+@lru_cache(maxsize=4096)
+def _cached_translate(tgt: str, text: str) -> str:
+    return _get_translator(tgt).translate(text)
+
+# langid's codes don't always match Google's target codes exactly
+# (e.g. langid says 'zh' for either Chinese variant)
+_LANG_EQUIV = {'zh-cn': 'zh', 'zh-tw': 'zh'}
+
+def _lang_equals(src: str, tgt: str) -> bool:
+    """True when translating src -> tgt would be a no-op."""
+    return src == tgt or _LANG_EQUIV.get(tgt.lower()) == src
+
 def translate_and_romanize(text: str, target_lang_code: str):
     """
     - Detect source language (safe)
     - Translate using GoogleTranslator (deep-translator)
     - Romanize translated text if needed according to target_lang_code
-    Returns (src_lang, translated_text, romanized_text)
+    Returns (src_lang, translated_text, romanized_text, normalized_target)
+    so callers don't have to re-run normalize_target_lang.
     """
     src = detect_language_safely(text)
     # Use normalized target lang (e.g., 'urdu' -> 'ur')
     tgt = normalize_target_lang(target_lang_code)
 
+    # Already in the target language: skip the Google round-trip entirely
+    if _lang_equals(src, tgt):
+        return src, text, romanize_text(text, tgt), tgt
+
     try:
-        translated = GoogleTranslator(source='auto', target=tgt).translate(text)
+        translated = _cached_translate(tgt, text)
     except Exception as e:
         translated = f"(translation error: {e})"
 
     roman = romanize_text(translated, tgt)
-    return src, translated, roman
+    return src, translated, roman, tgt
 
 # -------------------------
 # CLI loop
@@ -473,10 +673,10 @@ def prompt_loop():
         target_input = input("Translate into which language (name or code, e.g. 'ur' or 'Russian'): ").strip()
         if not target_input:
             target_input = 'en'
-        src_lang, translated, roman = translate_and_romanize(text, target_input)
+        src_lang, translated, roman, tgt = translate_and_romanize(text, target_input)
 
         print(f"\nDetected Language (heuristic): {src_lang}")
-        print(f"Translated ({normalize_target_lang(target_input)}): {translated}")
+        print(f"Translated ({tgt}): {translated}")
         print(f"Romanized: {roman}\n")
 
         again = input("Do you want to translate more? (yes/no): ").strip().lower()
@@ -485,7 +685,7 @@ def prompt_loop():
             break
 
 
-from flask import Flask, send_from_directory, request, jsonify
+from flask import Flask, Response, send_from_directory, request, jsonify
 from flask_cors import CORS
 import os
 # React build path
@@ -493,38 +693,227 @@ REACT_BUILD_DIR = os.path.join(os.path.dirname(__file__), "../translator-ui/buil
 
 app = Flask(__name__, static_folder=REACT_BUILD_DIR, static_url_path="/")
 CORS(app)
+# gzip/brotli responses when the client accepts it; long translations are
+# plain UTF-8 text and compress 60-80%
+try:
+    from flask_compress import Compress
+    Compress(app)
+except Exception:
+    pass
+# CRA emits content-hashed asset filenames, so browsers can cache them for
+# a year; index.html itself is served from the in-memory copy below.
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+
+@lru_cache(maxsize=1)
+def _index_html() -> bytes:
+    with open(os.path.join(app.static_folder, "index.html"), "rb") as f:
+        return f.read()
+
+def _serve_index():
+    # index.html is a few KB and hit on every navigation; serve the cached
+    # bytes instead of stat+open+read per request
+    try:
+        return Response(_index_html(), mimetype="text/html")
+    except OSError:
+        return send_from_directory(app.static_folder, "index.html")
 
 # Serve React frontend
 @app.route("/")
 def serve_react():
-    return send_from_directory(app.static_folder, "index.html")
+    return _serve_index()
+
+# -------------------------
+# Micro-batching for /api/translate
+# Concurrent requests for the same target language are coalesced into one
+# Google call (joined with a delimiter, split afterwards), which amortizes
+# the HTTP round-trip across the batch.
+# -------------------------
+_BATCH_SEP = "\n<<<SEP>>>\n"
+_BATCH_SPLIT_RE = re.compile(r"\s*<<<\s*SEP\s*>>>\s*")
+_BATCH_WINDOW = 0.05   # seconds to wait for more requests before flushing
+_BATCH_MAX = 20        # flush immediately once this many are queued
+
+class BatchQueue:
+    """Collects (text, Future) pairs for one target language and flushes
+    them as a single joined translation after a short window."""
+
+    def __init__(self, tgt):
+        self.tgt = tgt
+        self.lock = threading.Lock()
+        self.pending = []
+        self.timer = None
+
+    def submit(self, text):
+        fut = Future()
+        with self.lock:
+            self.pending.append((text, fut))
+            if len(self.pending) >= _BATCH_MAX:
+                batch, self.pending = self.pending, []
+                if self.timer:
+                    self.timer.cancel()
+                    self.timer = None
+                threading.Thread(
+                    target=self._flush, args=(batch,), daemon=True
+                ).start()
+            elif self.timer is None:
+                self.timer = threading.Timer(_BATCH_WINDOW, self._flush_pending)
+                self.timer.daemon = True
+                self.timer.start()
+        return fut
+
+    def _flush_pending(self):
+        with self.lock:
+            batch, self.pending = self.pending, []
+            self.timer = None
+        if batch:
+            self._flush(batch)
+
+    def _flush(self, batch):
+        if len(batch) > 1:
+            joined = _BATCH_SEP.join(text for text, _ in batch)
+            try:
+                parts = _BATCH_SPLIT_RE.split(
+                    _get_translator(self.tgt).translate(joined)
+                )
+            except Exception:
+                parts = None
+            if parts is not None and len(parts) == len(batch):
+                for (_, fut), part in zip(batch, parts):
+                    fut.set_result(part)
+                return
+        # single item, or the provider mangled the delimiter: translate
+        # each item on its own (still hits the result cache)
+        for text, fut in batch:
+            try:
+                fut.set_result(_cached_translate(self.tgt, text))
+            except Exception as e:
+                fut.set_exception(e)
+
+_batch_queues = {}
+
+def _batched_translate(tgt: str, text: str) -> str:
+    queue = _batch_queues.setdefault(tgt, BatchQueue(tgt))
+    return queue.submit(text).result(timeout=30)
+
+_BATCH_CAP = 50  # max items joined into a single provider call
+
+# Bounded pool for the per-item fallback path: 8 concurrent translations
+# keeps us well inside Google's rate limits while overlapping the I/O.
+_FALLBACK_POOL = ThreadPoolExecutor(max_workers=8)
+
+def _translate_one_safe(tgt: str, text: str) -> str:
+    try:
+        return _cached_translate(tgt, text)
+    except Exception as e:
+        return f"(translation error: {e})"
+
+def translate_and_romanize_batch(texts, target_lang_code):
+    """
+    Translate a list of texts with as few Google calls as possible: items
+    are joined with the batch delimiter in groups of up to _BATCH_CAP and
+    translated together, falling back to per-item translation whenever the
+    provider mangles the delimiter. Returns a list of
+    (src_lang, translated, romanized) tuples, one per input.
+    """
+    tgt = normalize_target_lang(target_lang_code)
+    translated_all = []
+    for i in range(0, len(texts), _BATCH_CAP):
+        chunk = texts[i:i + _BATCH_CAP]
+        translations = None
+        if len(chunk) > 1:
+            joined = _BATCH_SEP.join(chunk)
+            try:
+                parts = _BATCH_SPLIT_RE.split(_get_translator(tgt).translate(joined))
+                if len(parts) == len(chunk):
+                    translations = parts
+            except Exception:
+                translations = None
+        if translations is None:
+            # single item, or the joined call failed: translate items
+            # concurrently (each still hits the result cache first)
+            translations = list(
+                _FALLBACK_POOL.map(lambda t: _translate_one_safe(tgt, t), chunk)
+            )
+        translated_all.extend(translations)
+    return [
+        (detect_language_safely(t), tr, romanize_text(tr, tgt))
+        for t, tr in zip(texts, translated_all)
+    ]
+
+def _json_response(payload):
+    """Serialize with orjson when available (2-5x faster than stdlib json)."""
+    if orjson:
+        return Response(orjson.dumps(payload), mimetype="application/json")
+    return jsonify(payload)
 
 # API endpoint
 @app.route("/api/translate", methods=["POST"])
 def translate_api():
-    data = request.get_json()
+    if orjson:
+        try:
+            data = orjson.loads(request.get_data())
+        except Exception:
+            data = request.get_json()  # preserve Flask's 400 on bad bodies
+    else:
+        data = request.get_json()
     text = data.get("text", "")
     target = data.get("target", "en")
 
+    # Bulk mode: "text" may be a list of strings; the response mirrors the
+    # request shape with one result object per input item.
+    if isinstance(text, list):
+        results = translate_and_romanize_batch(text, target)
+        return _json_response([
+            {"source_lang": src, "translated": tr, "romanized": rom}
+            for src, tr, rom in results
+        ])
+
     if not text.strip():
-        return jsonify({
+        return _json_response({
             "source_lang": "-",
             "translated": "",
             "romanized": ""
         })
 
-    src_lang, translated, romanized = translate_and_romanize(text, target)
-
-    return jsonify({
+    src_lang = detect_language_safely(text)
+    tgt = normalize_target_lang(target)
+    if _lang_equals(src_lang, tgt):
+        # same-language pass-through: no Google round-trip needed
+        translated = text
+    else:
+        try:
+            translated = _batched_translate(tgt, text)
+        except Exception as e:
+            translated = f"(translation error: {e})"
+    romanized = romanize_text(translated, tgt)
+
+    resp = _json_response({
         "source_lang": src_lang,
         "translated": translated,
         "romanized": romanized
     })
+    # the result is deterministic for (text, target), so short inputs may
+    # be reused by the browser/CDN for a few minutes
+    if len(text) <= 512 and not translated.startswith("(translation error"):
+        resp.headers['Cache-Control'] = 'public, max-age=300'
+    return resp
 
 # For React Router — serve index.html for all other paths
 @app.errorhandler(404)
 def not_found(e):
-    return send_from_directory(app.static_folder, "index.html")
+    return _serve_index()
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    # Translation requests spend most of their time waiting on Google, so
+    # the single-threaded Werkzeug dev server serializes everything.
+    # Production deployments should use gunicorn (see gunicorn.conf.py);
+    # `python app.py` serves through waitress (16 threads) and only falls
+    # back to the debug dev server when explicitly requested.
+    if os.environ.get("FLASK_DEBUG") == "1":
+        app.run(debug=True, threaded=True)
+    else:
+        try:
+            from waitress import serve
+            serve(app, host="0.0.0.0", port=5000, threads=16)
+        except ImportError:
+            app.run(threaded=True)
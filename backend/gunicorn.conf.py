@@ -0,0 +1,16 @@
+"""
+Gunicorn config for the translator backend.
+
+Run from this directory with:
+    gunicorn -c gunicorn.conf.py app:app
+
+gevent workers let one worker keep many translations in flight: the
+outbound Google call yields during network I/O instead of blocking the
+whole process.
+"""
+import multiprocessing
+
+bind = "0.0.0.0:5000"
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = "gevent"
+worker_connections = 1000